@@ -0,0 +1,20 @@
+import os
+
+
+def list_dirs(path):
+    """
+    List the child directory names of the provided path. Compiled with
+    Cython to drop the interpreter dispatch from the traversal hot loop,
+    the pure python fallback lives in exdir.directory.
+
+    :param str path:
+    :return: Child directory names
+    :rtype: list[str]
+    """
+    cdef list names = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                names.append(entry.name)
+
+    return names
@@ -13,6 +13,8 @@ class Attribute(base.Serializer, MutableMapping):
     The Attribute uses a MutableMapping subclass to be able to serialize the
     data using a dictionary style interaction.
     """
+    __slots__ = ()
+
     data_type = OrderedDict
 
     def __setitem__(self, key, value):
@@ -21,14 +23,16 @@ class Attribute(base.Serializer, MutableMapping):
         :param value:
         """
         self.data[key] = value
-        self.set_unsaved_changes(True)
+        if not self._unsaved_changes:
+            self.set_unsaved_changes(True)
 
     def __delitem__(self, item):
         """
         :param str item:
         """
         del self.data[item]
-        self.set_unsaved_changes(True)
+        if not self._unsaved_changes:
+            self.set_unsaved_changes(True)
 
     def __getitem__(self, item):
         """
@@ -2,43 +2,248 @@ import os
 import abc
 import six
 import sys
+import mmap
+import errno
+import bisect
+import tempfile
 import shutil
 import weakref
 from collections import OrderedDict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     import ujson as json
 except ImportError:
     import json
 
 
+if orjson is not None:
+    def _dumps(data):
+        """
+        :param data:
+        :return: Serialized data
+        :rtype: bytes
+        """
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            # orjson rejects data the json module accepts, integers
+            # outside of 64 bits for example, fall back so installing
+            # orjson never makes previously committable data fail.
+            return json.dumps(data, indent=4).encode("utf-8")
+
+    def _loads(buffer):
+        """
+        :param buffer:
+        :return: Data
+        """
+        try:
+            return orjson.loads(buffer)
+        except orjson.JSONDecodeError:
+            # mirrors the _dumps fallback, orjson also refuses to parse
+            # integers outside of 64 bits.
+            return json.loads(bytes(buffer).decode("utf-8"))
+else:
+    def _dumps(data):
+        """
+        :param data:
+        :return: Serialized data
+        :rtype: bytes
+        """
+        return json.dumps(data, indent=4).encode("utf-8")
+
+    if sys.version_info >= (3, 7) or json.__name__ == "ujson":
+        _loads = json.loads
+    else:
+        def _loads(buffer):
+            """
+            :param bytes buffer:
+            :return: Data
+            """
+            return json.loads(buffer, object_pairs_hook=OrderedDict)
+
+
+def _read(path):
+    """
+    Read and parse the provided json file. Larger files are memory mapped
+    when the parser accepts buffer objects, which saves the intermediate
+    copy into a bytes object.
+
+    :param str path:
+    :return: Data
+    """
+    with open(path, "rb") as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < 4096:
+            return _loads(f.read())
+
+        memory = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(memory)
+        try:
+            return _loads(view)
+        finally:
+            view.release()
+            memory.close()
+
+
 __all__ = [
     "Object",
     "Deferred",
-    "Serializer"
+    "Serializer",
+    "DataCache"
 ]
 
 
+class DataCache(object):
+    """
+    The DataCache is a size bounded LRU cache that tracks serializers with
+    parsed data. When the cache grows past its maximum size the least
+    recently used serializer has its data dropped, forcing a re-read from
+    disk on the next access. Serializers with unsaved changes are never
+    evicted. This keeps the memory footprint of long running processes
+    bounded where the weak instance cache alone has no eviction policy.
+    """
+    def __init__(self, maxsize=1024):
+        self._maxsize = maxsize
+        self._serializers = OrderedDict()
+
+    # ------------------------------------------------------------------------
+
+    @property
+    def maxsize(self):
+        """
+        :return: Maximum size
+        :rtype: int
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize):
+        """
+        :param int maxsize:
+        """
+        self._maxsize = maxsize
+        self._evict()
+
+    # ------------------------------------------------------------------------
+
+    def touch(self, serializer):
+        """
+        Mark the provided serializer as most recently used and evict the
+        least recently used serializers when over capacity.
+
+        :param Serializer serializer:
+        """
+        path = serializer.path
+        if path in self._serializers:
+            del self._serializers[path]
+
+        self._serializers[path] = weakref.ref(serializer)
+        self._evict()
+
+    def discard(self, serializer):
+        """
+        :param Serializer serializer:
+        """
+        self._serializers.pop(serializer.path, None)
+
+    def _evict(self):
+        """
+        Evict least recently used serializers until the cache fits its
+        maximum size, serializers with unsaved changes are skipped.
+        """
+        while len(self._serializers) > self._maxsize:
+            _, reference = self._serializers.popitem(last=False)
+            serializer = reference()
+            if serializer is not None and not serializer.has_unsaved_changes():
+                serializer.clear_cache(commit_changes=False)
+
+
+data_cache = DataCache()
+
+
 class WeakCache(abc.ABCMeta):
     """
-    The WeakCache is a metaclass that will cache the created instances in a
-    weak dictionary. This will ensure that the same class is returned if the
-    initialization arguments have already been used.
+    The WeakCache is a metaclass that will cache the created instances using
+    weak references. This will ensure that the same class is returned if the
+    initialization arguments have already been used. The references live in
+    plain dictionaries and are evicted by a finalizer when the instance is
+    garbage collected, which keeps the hit path a single dictionary lookup
+    without the KeyedRef indirection of a WeakValueDictionary.
     """
     def __init__(cls, *args, **kwargs):
         super(WeakCache, cls).__init__(*args, **kwargs)
-        cls.cache = weakref.WeakValueDictionary()
+        cls.cache = {}
+        cls.path_index = {}
+        cls._sorted_paths = None
 
     def __call__(cls, *args, **kwargs):
-        key = str(args) + str(kwargs)
-        try:
-            instance = cls.cache[key]
-        except KeyError:
-            instance = super(WeakCache, cls).__call__(*args, **kwargs)
-            cls.cache[key] = instance
+        key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+        reference = cls.cache.get(key)
+        if reference is not None:
+            instance = reference()
+            if instance is not None:
+                return instance
+
+        instance = super(WeakCache, cls).__call__(*args, **kwargs)
+        reference = weakref.ref(instance)
+        cls.cache[key] = reference
+        cls.path_index[instance.path] = reference
+        cls._sorted_paths = None
+        weakref.finalize(instance, cls._evict, key, instance.path, reference)
 
         return instance
 
+    def _evict(cls, key, path, reference):
+        """
+        Remove the provided reference from the cache dictionaries, entries
+        are only removed when they still point to the collected instance.
+
+        :param key:
+        :param str path:
+        :param weakref.ref reference:
+        """
+        if cls.cache.get(key) is reference:
+            del cls.cache[key]
+        if cls.path_index.get(path) is reference:
+            del cls.path_index[path]
+            cls._sorted_paths = None
+
+    def instances(cls, prefix):
+        """
+        Yield the cached instances with a path that falls under the provided
+        prefix path. The sorted path index keys are cached on the class and
+        invalidated on insert and evict, so repeated subtree lookups only
+        visit the matching range without re-sorting.
+
+        :param str prefix:
+        :return: Instances
+        :rtype: generator
+        """
+        if cls._sorted_paths is None:
+            cls._sorted_paths = sorted(cls.path_index.keys())
+
+        boundary = prefix + os.sep
+        paths = cls._sorted_paths
+        for path in paths[bisect.bisect_left(paths, prefix):]:
+            if not path.startswith(prefix):
+                break
+            elif path != prefix and not path.startswith(boundary):
+                # siblings like 'foo2' share the raw string prefix 'foo'
+                # but are not descendants.
+                continue
+
+            reference = cls.path_index.get(path)
+            instance = reference() if reference is not None else None
+            if instance is not None:
+                yield instance
+
 
 @six.add_metaclass(WeakCache)
 class Object(object):
@@ -48,8 +253,12 @@ class Object(object):
     the Object is weak cached which will make sure the same instance of the
     Object is returned to reduce the memory footprint.
     """
+    __slots__ = ("__weakref__", "_path", "_bpath", "_parent_path", "_file")
+
     def __init__(self, path, f):
         self._path = os.path.normpath(path)
+        self._bpath = os.fsencode(self._path)
+        self._parent_path = os.path.split(self._path)[0]
         self._file = f
 
     def __eq__(self, other):
@@ -64,6 +273,9 @@ class Object(object):
 
         return self.path != other
 
+    def __hash__(self):
+        return hash(self._path)
+
     def __repr__(self):
         return "<{}.{} object to '{}'>".format(
             self.__class__.__module__,
@@ -81,6 +293,14 @@ class Object(object):
         """
         return self._path
 
+    @property
+    def parent_path(self):
+        """
+        :return: Parent path
+        :rtype: str
+        """
+        return self._parent_path
+
     @property
     def file(self):
         """
@@ -93,20 +313,23 @@ class Object(object):
 
     def exists(self):
         """
+        The cached bytes variant of the path is handed to the syscall
+        directly, skipping the fsencode of the str path on every probe.
+
         :return: Exist state
         :rtype: bool
         """
-        return os.path.exists(self.path)
+        return os.path.exists(self._bpath)
 
     def delete(self):
         """
         Remove the path from disk. If its a folder the entire directory
         including any content is removed.
         """
-        if os.path.isdir(self.path):
+        if os.path.isdir(self._bpath):
             shutil.rmtree(self.path, ignore_errors=False)
-        elif os.path.isfile(self.path):
-            os.remove(self.path)
+        elif os.path.isfile(self._bpath):
+            os.remove(self._bpath)
 
 
 class Deferred(Object):
@@ -115,6 +338,8 @@ class Deferred(Object):
     called. The commit messaged are handled through the recording of
     unsaved changes.
     """
+    __slots__ = ("_unsaved_changes", "_pending_deletion")
+
     def __init__(self, path, f):
         super(Deferred, self).__init__(path, f)
         self._unsaved_changes = False
@@ -176,11 +401,14 @@ class Serializer(Deferred):
     default. Changes are stored in memory first but can be committed to disk,
     the File object keeps track of all these changes.
     """
+    __slots__ = ("_data", "_checksum", "_initialized")
+
     data_type = None
 
     def __init__(self, path, f):
         super(Serializer, self).__init__(path, f)
         self._data = self.default
+        self._checksum = None
         self._initialized = False
 
     # ------------------------------------------------------------------------
@@ -194,31 +422,46 @@ class Serializer(Deferred):
 
     # ------------------------------------------------------------------------
 
+    def _reraise(self):
+        """
+        Re-raise the active exception with the serializer path appended to
+        the message, making it easier to track down the offending file.
+        """
+        t, v, tb = sys.exc_info()
+        message = "{} in '{}'.".format(v, self.path)
+        try:
+            v = t(message)
+        except TypeError:
+            v = RuntimeError(message)
+
+        six.reraise(t, v, tb)
+
+    # ------------------------------------------------------------------------
+
     @property
     def data(self):
         """
         Set the internal data by reading the file from disk if the path
         exists. This internal data is returned every time tis property is
-        accessed.
+        accessed. The file is opened directly rather than testing for its
+        existence first, which saves a stat call per access for serializers
+        that have no file on disk yet.
 
         :return: Data
         """
-        if not self._initialized and self.exists():
+        if not self._initialized:
             try:
-                with open(self.path, "r") as f:
-                    self._data = json.load(f, object_pairs_hook=OrderedDict)
-                self._initialized = True
+                self._data = _read(self.path)
                 self.set_unsaved_changes(False)
-            except Exception as e:
-                t, v, tb = sys.exc_info()
-                message = "{} in '{}'.".format(e, self.path)
-                try:
-                    v = t(message)
-                except TypeError:
-                    v = RuntimeError(message)
+            except EnvironmentError as e:
+                if e.errno != errno.ENOENT:
+                    self._reraise()
+            except Exception:
+                self._reraise()
 
-                raise six.reraise(t, v, tb)
+            self._initialized = True
 
+        data_cache.touch(self)
         return self._data
 
     @data.setter
@@ -244,6 +487,7 @@ class Serializer(Deferred):
         self._initialized = True
         self._pending_deletion = False
         self.set_unsaved_changes(True)
+        data_cache.touch(self)
 
     # ------------------------------------------------------------------------
 
@@ -251,17 +495,34 @@ class Serializer(Deferred):
         """
         Write the current data to disk. If the directory doesn't exist yet it
         will be created. If the file is set for deletion the Objects delete
-        method is called.
+        method is called. The write is skipped when the serialized data
+        matches the last written state or when the data still equals the
+        default and no file exists on disk yet. The data is written to a
+        temporary file first and renamed in place so a crash mid write can
+        never corrupt the existing file.
         """
         if self._pending_deletion:
             super(Serializer, self).commit()
+            self._checksum = None
         else:
-            directory = os.path.split(self.path)[0]
-            if not os.path.exists(directory):
-                os.makedirs(directory, mode=0o777)
+            buffer = _dumps(self._data)
+            checksum = hash(buffer)
+            exists = self.exists()
+            if (checksum != self._checksum or not exists) and \
+                    (exists or self._data != self.default):
+                directory = self.parent_path
+                os.makedirs(directory, mode=0o777, exist_ok=True)
+
+                handle, temporary = tempfile.mkstemp(
+                    dir=directory,
+                    prefix=os.path.basename(self.path)
+                )
+                with os.fdopen(handle, "wb") as f:
+                    f.write(buffer)
+                os.chmod(temporary, 0o644)
+                os.replace(temporary, self.path)
 
-            with open(self.path, "w") as f:
-                json.dump(self._data, f, indent=4)
+                self._checksum = checksum
 
         self._initialized = True
         self._pending_deletion = False
@@ -285,6 +546,7 @@ class Serializer(Deferred):
         self._data = self.default
         self._initialized = False
         self._pending_deletion = False
+        data_cache.discard(self)
 
     def delete(self):
         """
@@ -14,6 +14,8 @@ class DataSet(attribute.Attribute):
     as their own individual files. This will ensure that the data will only be
     read from disk when required.
     """
+    __slots__ = ()
+
     def __setitem__(self, key, value):
         """
         :param str key:
@@ -38,14 +40,33 @@ class DataSet(attribute.Attribute):
 
     # ------------------------------------------------------------------------
 
+    def update_bulk(self, mapping):
+        """
+        Set the provided mapping of keys and values in one pass. The header
+        is updated and marked changed once rather than per key, which makes
+        this the preferred way of inserting many data sets at the same time.
+
+        :param dict mapping:
+        """
+        data = self.data
+        for key in mapping:
+            data[key] = None
+
+        if not self._unsaved_changes:
+            self.set_unsaved_changes(True)
+
+        for key, value in mapping.items():
+            self.serializer(key).data = value
+
+    # ------------------------------------------------------------------------
+
     def serializer(self, item):
         """
         :param str item:
         :return: Serializer
         :rtype: Serializer
         """
-        directory = os.path.split(self.path)[0]
-        return base.Serializer(os.path.join(directory, item), self.file)
+        return base.Serializer(os.path.join(self.parent_path, item), self.file)
 
     def commit(self):
         """
@@ -1,11 +1,20 @@
 import os
+import stat
+import heapq
 import weakref
+import contextlib
+from concurrent import futures
 from six.moves.collections_abc import Mapping
 
 from exdir import base
 from exdir import attribute
 from exdir import data_set
 
+try:
+    from exdir import _fast
+except ImportError:
+    _fast = None
+
 
 __all__ = [
     "Directory",
@@ -13,6 +22,54 @@ __all__ = [
 ]
 
 
+_DIR_FD_SUPPORTED = (
+    hasattr(os, "O_DIRECTORY")
+    and os.stat in os.supports_dir_fd
+    and os.scandir in os.supports_fd
+)
+
+
+def _scan(path):
+    """
+    :param str path:
+    :return: Child directory names
+    :rtype: set[str]
+    """
+    try:
+        if _fast is not None:
+            return set(_fast.list_dirs(path))
+
+        with os.scandir(path) as entries:
+            return {
+                entry.name
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            }
+    except OSError:
+        return set()
+
+
+def _iter_sorted(names):
+    """
+    Yield the provided names in sorted order. Larger collections are
+    heapified and popped lazily so a consumer that terminates early only
+    pays for the entries it actually takes, smaller collections are sorted
+    outright where the constant factor wins. The provided list is consumed.
+
+    :param list[str] names:
+    :return: Names
+    :rtype: generator[str]
+    """
+    if len(names) > 64:
+        heapq.heapify(names)
+        while names:
+            yield heapq.heappop(names)
+    else:
+        names.sort()
+        for name in names:
+            yield name
+
+
 class Directory(base.Deferred, Mapping):
     """
     The Directory represents a folder on disk. It can be assumed the
@@ -23,12 +80,29 @@ class Directory(base.Deferred, Mapping):
     doesn't exist it will be stored in memory but still listed as one of
     the current Directories children.
     """
+    __slots__ = (
+        "_path_sep",
+        "_memory",
+        "_parent",
+        "_listing",
+        "_fd",
+        "_fd_finalize",
+        "_meta",
+        "_attr",
+        "_data_set"
+    )
+
     def __init__(self, path, f):
         super(Directory, self).__init__(path, f)
+        self._path_sep = self._path + os.sep
         self._memory = weakref.WeakValueDictionary()
-        self._meta = attribute.Attribute(os.path.join(self.path, ".meta"), self.file)
-        self._attr = attribute.Attribute(os.path.join(self.path, ".attributes"), self.file)
-        self._data_set = data_set.DataSet(os.path.join(self.path, ".data_sets"), self.file)
+        self._parent = None
+        self._listing = None
+        self._fd = None
+        self._fd_finalize = None
+        self._meta = None
+        self._attr = None
+        self._data_set = None
 
     def __getitem__(self, item):
         """
@@ -42,16 +116,29 @@ class Directory(base.Deferred, Mapping):
         if item in self._memory:
             return self._memory[item]
 
-        path = os.path.join(self.path, item)
-        path = os.path.normpath(path)
-        if not os.path.exists(path):
-            raise KeyError("Path '{}' doesn't exist.".format(self.path))
-        elif not os.path.isdir(path):
-            raise KeyError("Path '{}' is not a directory.".format(self.path))
+        path = self._path_sep + item
+        simple = not (os.sep in item or (os.altsep and os.altsep in item) or "." in item)
+        listed = False
+        if not simple:
+            path = os.path.normpath(path)
+        else:
+            listed = item in self._children()
+
+        if not listed:
+            handle = self._dir_fd() if simple else None
+            try:
+                if handle is not None:
+                    state = os.stat(item, dir_fd=handle)
+                else:
+                    state = os.stat(path)
+            except OSError:
+                raise KeyError("Path '{}' doesn't exist.".format(path))
+            if not stat.S_ISDIR(state.st_mode):
+                raise KeyError("Path '{}' is not a directory.".format(path))
 
         obj = Directory(path, self.file)
         if obj.pending_deletion():
-            raise KeyError("Path '{}' exists, but is pending deletion.".format(self.path))
+            raise KeyError("Path '{}' exists, but is pending deletion.".format(path))
 
         return obj
 
@@ -61,41 +148,158 @@ class Directory(base.Deferred, Mapping):
         """
         self[item].delete()
 
+    def __contains__(self, item):
+        """
+        Answer the membership test for simple names from the cached listing
+        and memory rather than routing through __getitem__, which stats the
+        path and raises a KeyError on a miss. Names containing separators or
+        dot segments keep the exception based lookup.
+
+        :param str item:
+        :return: Contains state
+        :rtype: bool
+        """
+        if os.sep in item or (os.altsep and os.altsep in item) or "." in item:
+            return super(Directory, self).__contains__(item)
+
+        directory = self._memory.get(item)
+        if directory is None:
+            if item not in self._children():
+                return False
+
+            reference = Directory.path_index.get(self._path_sep + item)
+            directory = reference() if reference is not None else None
+
+        return directory is None or not directory.pending_deletion()
+
     def __iter__(self):
         """
+        The union of the on disk and in memory names is yielded in sorted
+        order lazily, so a consumer that stops after the first few entries
+        of a large directory doesn't pay for a full sort.
+
         :return: Directories
         :rtype: generator[Directory]
         """
-        directories = next(os.walk(str(self.path)))[1]
-        directories = set(directories + list(self._memory.keys()))
-        for name in sorted(directories):
-            obj = Directory(os.path.join(self.path, name), self.file)
+        base = self._path_sep
+        names = set(self._children())
+        names.update(self._memory.keys())
+        for name in _iter_sorted(list(names)):
+            obj = Directory(base + name, self.file)
             if not obj.pending_deletion():
                 yield obj
 
     def __len__(self):
         """
+        Count the child directory names without constructing Directory
+        objects or joining a path per name. Only the cached instances under
+        this directory are visited to correct for pending deletions.
+
         :return: Length
         :rtype: int
         """
-        return len([a for a in self])
+        names = set(self._children())
+        names.update(self._memory.keys())
+
+        count = len(names)
+        for directory in Directory.instances(self.path):
+            if directory.pending_deletion() and \
+                    directory.parent_path == self.path and \
+                    os.path.basename(directory.path) in names:
+                count -= 1
+
+        return count
+
+    # ------------------------------------------------------------------------
+
+    def _children(self):
+        """
+        Retrieve the child directory names from disk using os.scandir, which
+        answers is_dir from the directory entry without an additional stat
+        call. Directories that only live in memory are not included. The
+        listing is cached on the instance and invalidated when the contents
+        change through a commit or cache clear.
+
+        :return: Child directory names
+        :rtype: set[str]
+        """
+        if self._listing is None:
+            handle = self._dir_fd()
+            if handle is None:
+                self._listing = _scan(self.path)
+            else:
+                try:
+                    with os.scandir(handle) as entries:
+                        self._listing = {
+                            entry.name
+                            for entry in entries
+                            if entry.is_dir(follow_symlinks=False)
+                        }
+                except OSError:
+                    self._listing = set()
+
+        return self._listing
+
+    def _dir_fd(self):
+        """
+        Lazily open a file descriptor to the directory so scans and child
+        stats can be issued relative to it, skipping the kernel path walk
+        over all leading components per call. The descriptor is closed by a
+        finalizer when the instance is collected, or earlier through
+        _invalidate. Returns None when unsupported or the directory doesn't
+        exist on disk.
+
+        :return: Directory file descriptor
+        :rtype: int/None
+        """
+        if self._fd is None and _DIR_FD_SUPPORTED:
+            try:
+                self._fd = os.open(self.path, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                return None
+
+            self._fd_finalize = weakref.finalize(self, os.close, self._fd)
+
+        return self._fd
+
+    def _invalidate(self):
+        """
+        Drop the cached listing and close the directory file descriptor,
+        forcing the next access to go back to disk. Required when the
+        directory is deleted or might have been recreated.
+        """
+        self._listing = None
+        self._fd = None
+        if self._fd_finalize is not None:
+            self._fd_finalize()
+            self._fd_finalize = None
 
     # ------------------------------------------------------------------------
 
     @property
     def parent(self):
         """
+        The parent is memoized using a weak reference so repeated upward
+        walks skip the instance cache lookup, without keeping the ancestor
+        chain alive on behalf of its children.
+
         :return: Parent
         :rtype: Directory/File
         :raise RuntimeError: When the hierarchy is already at root.
         """
-        parent_directory = os.path.split(self.path)[0]
         if self.file.path == self.path:
             raise OSError("Unable to retrieve parent from File.")
-        elif parent_directory == self.file.path:
-            return self.file
-        else:
-            return Directory(parent_directory, self.file)
+
+        parent = self._parent() if self._parent is not None else None
+        if parent is None:
+            if self.parent_path == self.file.path:
+                parent = self.file
+            else:
+                parent = Directory(self.parent_path, self.file)
+
+            self._parent = weakref.ref(parent)
+
+        return parent
 
     # ------------------------------------------------------------------------
 
@@ -105,6 +309,8 @@ class Directory(base.Deferred, Mapping):
         :return: Meta
         :rtype: Attribute
         """
+        if self._meta is None:
+            self._meta = attribute.Attribute(self._path_sep + ".meta", self.file)
         return self._meta
 
     @property
@@ -113,6 +319,8 @@ class Directory(base.Deferred, Mapping):
         :return: Attribute
         :rtype: Attribute
         """
+        if self._attr is None:
+            self._attr = attribute.Attribute(self._path_sep + ".attributes", self.file)
         return self._attr
 
     @property
@@ -121,6 +329,8 @@ class Directory(base.Deferred, Mapping):
         :return: Data set
         :rtype: DataSet
         """
+        if self._data_set is None:
+            self._data_set = data_set.DataSet(self._path_sep + ".data_sets", self.file)
         return self._data_set
 
     # ------------------------------------------------------------------------
@@ -132,7 +342,7 @@ class Directory(base.Deferred, Mapping):
         :rtype: Directory
         :raise OSError: When the storage already exists.
         """
-        directory = os.path.join(self.path, name)
+        directory = self._path_sep + name
         if os.path.exists(directory):
             raise OSError("Unable to create folder from path '{}', "
                           "it already exists.".format(directory))
@@ -143,35 +353,125 @@ class Directory(base.Deferred, Mapping):
 
     def require_group(self, name):
         """
+        Simple names are answered from the memory and listing caches without
+        raising, the exception based lookup only remains for names that
+        contain separators or dot segments.
+
         :param str name:
         :return: Directory
         :rtype: Directory
         """
-        try:
-            return self[name]
-        except KeyError:
-            return self.create_group(name)
+        directory = self._memory.get(name)
+        if directory is not None:
+            return directory
+
+        if os.sep in name or (os.altsep and os.altsep in name) or "." in name:
+            try:
+                return self[name]
+            except KeyError:
+                return self.create_group(name)
+
+        if name in self._children():
+            directory = Directory(self._path_sep + name, self.file)
+            if not directory.pending_deletion():
+                return directory
+
+        return self.create_group(name)
+
+    def walk(self, max_workers=8):
+        """
+        Breadth first walk over all descendant directories. The directory
+        scans of independent subdirectories are issued from a thread pool so
+        the file system latency overlaps, while the Directory objects are
+        constructed and yielded on the calling thread.
+
+        :param int max_workers:
+        :return: Directories
+        :rtype: generator[Directory]
+        """
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            queue = [(self, pool.submit(_scan, self.path))]
+            while queue:
+                batch, queue = queue, []
+                for parent, future in batch:
+                    names = future.result()
+                    names.update(parent._memory.keys())
+
+                    base = parent._path_sep
+                    for name in _iter_sorted(list(names)):
+                        obj = Directory(base + name, self.file)
+                        if obj.pending_deletion():
+                            continue
+
+                        queue.append((obj, pool.submit(_scan, obj.path)))
+                        yield obj
 
     # ------------------------------------------------------------------------
 
+    def commit(self):
+        """
+        Commit the deferred deletion and invalidate the cached listings of
+        this directory and its parent as the contents on disk changed. Top
+        level groups have the File as their parent, which lives in its own
+        per class instance cache and is reached through the file reference
+        instead.
+        """
+        super(Directory, self).commit()
+        self._invalidate()
+
+        if self.parent_path == self.file.path:
+            self.file._listing = None
+        else:
+            reference = Directory.path_index.get(self.parent_path)
+            parent = reference() if reference is not None else None
+            if parent is not None:
+                parent._listing = None
+
     def clear_cache(self, commit_changes=True):
         """
         Loop all cached attributes and data sets and if the are a child of the
         current directory they will have their cache cleared. Meaning that if
-        the data is requested again it will be retrieved from disk.
+        the data is requested again it will be retrieved from disk. Unsaved
+        changes are committed as one batch with a single synchronization
+        barrier per touched directory, rather than flushing each file on its
+        own. The cached directory listings underneath are dropped as well.
 
         :param bool commit_changes:
         """
+        instances = []
         for cls in [base.Serializer, attribute.Attribute, data_set.DataSet]:
-            for instance in cls.cache.values():
-                if instance.path.startswith(self.path):
-                    instance.clear_cache(commit_changes=commit_changes)
+            instances.extend(cls.instances(self.path))
+
+        if commit_changes:
+            dirty = [
+                instance
+                for instance in instances
+                if instance.has_unsaved_changes()
+            ]
+            for instance in dirty:
+                instance.commit()
+            if dirty:
+                File._synchronize({
+                    instance.parent_path
+                    for instance in dirty
+                })
+
+        for instance in instances:
+            instance.clear_cache(commit_changes=False)
+
+        self._invalidate()
+        for directory in Directory.instances(self.path):
+            directory._invalidate()
 
 
 class File(Directory):
+    __slots__ = ("unsaved_changes", "_commit_pool", "_buffer_depth")
+
     def __init__(self, directory):
         super(File, self).__init__(directory, self)
         self.unsaved_changes = {}
+        self._commit_pool = None
+        self._buffer_depth = 0
 
         if not os.path.exists(self.path):
             raise OSError("File '{}' doesn't exist.".format(self.path))
@@ -193,19 +493,86 @@ class File(Directory):
         if add:
             self.unsaved_changes[serializer.path] = serializer
         else:
-            self.unsaved_changes.pop(self.path, None)
+            self.unsaved_changes.pop(serializer.path, None)
 
     # ------------------------------------------------------------------------
 
+    @contextlib.contextmanager
+    def buffered(self):
+        """
+        Context manager that buffers up any number of changes and commits
+        them in one batch when the outer most context exits without an
+        error. This is the preferred way of doing bulk mutations as it
+        reduces the individual writes to a single flush at the end.
+
+        :return: File
+        :rtype: generator[File]
+        """
+        self._buffer_depth += 1
+        try:
+            yield self
+            if self._buffer_depth == 1:
+                self.commit()
+        finally:
+            self._buffer_depth -= 1
+
     def commit(self):
         """
-        Loop over all unsaved changes and commit them individually. This will
-        force any changes within the file to be written to disk.
+        Commit all unsaved changes, this will force any changes within the
+        file to be written to disk. As the writes are independent of each
+        other they are submitted to a thread pool so the file system calls
+        can overlap, pending deletions are committed afterwards so a write
+        can never resurrect a directory the same batch deletes. Every change
+        removes itself from the change log as it commits, changes that fail
+        to commit remain tracked.
         """
-        for serializer in self.unsaved_changes.values():
-            serializer.commit()
+        serializers = list(self.unsaved_changes.values())
+        writes = [s for s in serializers if not s.pending_deletion()]
+        deletions = [s for s in serializers if s.pending_deletion()]
 
-        self.unsaved_changes.clear()
+        try:
+            if len(writes) == 1:
+                writes[0].commit()
+            elif writes:
+                if self._commit_pool is None:
+                    self._commit_pool = futures.ThreadPoolExecutor(
+                        max_workers=min(32, (os.cpu_count() or 1) * 4)
+                    )
+
+                list(self._commit_pool.map(lambda s: s.commit(), writes))
+
+            for serializer in deletions:
+                serializer.commit()
+        finally:
+            if serializers:
+                self._synchronize({s.parent_path for s in serializers})
+                self._listing = None
+                for directory in Directory.instances(self.path):
+                    directory._listing = None
+
+    @staticmethod
+    def _synchronize(directories):
+        """
+        Issue a single fsync per provided directory so all buffered writes
+        and renames of a batch are made durable with one barrier each,
+        rather than syncing per committed file. Platforms without directory
+        file descriptors skip the barrier.
+
+        :param set[str] directories:
+        """
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+
+        for directory in directories:
+            try:
+                handle = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                continue
+
+            try:
+                os.fsync(handle)
+            finally:
+                os.close(handle)
         
     def close(self):
         """
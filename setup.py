@@ -1,2 +1,9 @@
 from setuptools import setup
-setup()
\ No newline at end of file
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize("exdir/_fast.pyx", language_level=3)
+except ImportError:
+    ext_modules = []
+
+setup(ext_modules=ext_modules)
\ No newline at end of file
@@ -28,3 +28,10 @@ class AttributeTestCase(unittest.TestCase):
 
         serializer = self.data_set.serializer("weights")
         self.assertTrue(serializer.exists())
+
+    def test_update_bulk(self):
+        self.data_set.update_bulk({"weights": [1] * 5, "colors": [2] * 5})
+        self.data_set.commit()
+
+        self.assertEqual(self.data_set["weights"], [1] * 5)
+        self.assertEqual(self.data_set["colors"], [2] * 5)
@@ -44,6 +44,44 @@ class DirectoryTestCase(unittest.TestCase):
         child.clear_cache(commit_changes=False)
         self.assertFalse("key" in child.attr)
 
+    def test_walk(self):
+        os.makedirs(os.path.join(self.path, "a", "b"), mode=0o777)
+        os.makedirs(os.path.join(self.path, "c"), mode=0o777)
+
+        paths = [directory.path for directory in self.file.walk()]
+        self.assertEqual(
+            paths,
+            [
+                os.path.join(self.path, "a"),
+                os.path.join(self.path, "c"),
+                os.path.join(self.path, "a", "b"),
+            ]
+        )
+
+    def test_contains(self):
+        folder = os.path.join(self.path, "exdir", "nested")
+        os.makedirs(folder, mode=0o777)
+        self.file.close()  # folder created outside of the api
+
+        self.assertIn("exdir", self.file)
+        self.assertIn(os.path.join("exdir", "nested"), self.file)
+        self.assertNotIn("exdir_not_existing", self.file)
+
+        del self.file["exdir"]
+        self.assertNotIn("exdir", self.file)
+        self.file.commit()
+
+    def test_commit(self):
+        os.makedirs(os.path.join(self.path, "commit"), mode=0o777)
+        self.file.close()  # folder created outside of the api
+
+        child = self.file["commit"]
+        child.delete()
+        child.commit()
+
+        self.assertNotIn("commit", self.file)
+        self.assertEqual(len(self.file), 0)
+
     def test_magic_methods(self):
         self.file.require_group("exdir")  # not in memory
         self.assertEqual(len(self.file), 0)
@@ -78,4 +116,19 @@ class FileTestCase(unittest.TestCase):
         self.assertTrue(self.file.has_unsaved_changes())
 
         self.file.commit()
-        self.assertFalse(self.file.has_unsaved_changes())
\ No newline at end of file
+        self.assertFalse(self.file.has_unsaved_changes())
+
+    def test_handle_unsaved_changes(self):
+        child = self.file.require_group("exdir")
+        child.attr["key"] = "value"
+
+        child.attr.set_unsaved_changes(False)
+        self.assertFalse(self.file.has_unsaved_changes())
+
+    def test_buffered(self):
+        with self.file.buffered():
+            child = self.file.require_group("buffered")
+            child.attr["key"] = "value"
+
+        self.assertFalse(self.file.has_unsaved_changes())
+        self.assertTrue(child.attr.exists())
\ No newline at end of file